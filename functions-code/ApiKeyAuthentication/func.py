@@ -1,13 +1,45 @@
 import io
-import json
 import logging
+import hashlib
+import orjson
+import re
+import time
 import datetime
 from datetime import timedelta
 
 from fdk import response
 
 import io
-import json
+
+# Hard-coded set of API Keys. Built once per container, on cold start.
+valid_api_keys = frozenset({"11cb5027-28d2-4359-b8e8-cc209a963a0d",
+                            "6340df79-56c7-401d-b6d0-2cdfb0591ea6",
+                            "58717bb9-44a1-4072-b498-c78c22a85919"})
+
+# Response bodies are constant, so they are serialized only once.
+_OK_BODY = orjson.dumps({"active": True}).decode()
+_UNAUTH_BODY = orjson.dumps({"active": False, "wwwAuthenticate": "API-key"}).decode()
+
+# Short-lived cache of recently authorized payloads: payload digest -> expiry (time.monotonic()).
+_AUTH_TTL = 30.0
+_AUTH_CACHE_MAX_SIZE = 1024
+_AUTH_CACHE: dict = {}
+
+# Extracts data["api-key"] straight from the raw payload, without deserializing the whole event.
+# Only trusted when the payload has a single "data" and a single "api-key", and no escape sequences that could hide
+# other keys from the byte counts. Any other payload goes through a full parse.
+_API_KEY_RE = re.compile(rb'"data"\s*:\s*\{\s*"api-key"\s*:\s*"([0-9a-f-]{36})"')
+
+
+def _sweep_auth_cache(now: float):
+    """
+    Removes the expired entries from the authorization cache, and empties it if it is still too large.
+    """
+    for key in [key for key, expiry in _AUTH_CACHE.items() if expiry <= now]:
+        del _AUTH_CACHE[key]
+    if len(_AUTH_CACHE) >= _AUTH_CACHE_MAX_SIZE:
+        _AUTH_CACHE.clear()
+
 
 def handler(ctx, data: io.BytesIO = None):
     """
@@ -21,24 +53,41 @@ def handler(ctx, data: io.BytesIO = None):
         data : The JSON string payload containing details about the OCI event and the image to process.
     """    
     logging.getLogger().setLevel(logging.INFO)
-    logging.getLogger().info(data.getvalue().decode('utf-8'))
 
-    # Hard-coded set of API Keys
-    valid_api_keys = ["11cb5027-28d2-4359-b8e8-cc209a963a0d",
-                      "6340df79-56c7-401d-b6d0-2cdfb0591ea6",
-	                  "58717bb9-44a1-4072-b498-c78c22a85919"]
+    # A payload recently authorized by this container is authorized again without being re-parsed.
+    payload = data.getvalue()
+    cache_key = hashlib.blake2b(payload, digest_size=16).digest()
+    now = time.monotonic()
+    if _AUTH_CACHE.get(cache_key, 0) > now:
+        logging.getLogger().info("Result: Authorized (cached)")
+        return response.Response(
+            ctx, 
+            status_code=200, 
+            response_data=_OK_BODY
+        )
 
     try:
-        auth_token = json.loads(data.getvalue())
-        token = auth_token.get("data").get("api-key")
+        match = None
+        if payload.count(b'"api-key"') == 1 and payload.count(b'"data"') == 1 and b"\\" not in payload:
+            match = _API_KEY_RE.search(payload)
+        if match:
+            token = match.group(1).decode()
+        else:
+            # Fall back to a full parse of the payload
+            auth_token = orjson.loads(data.getbuffer())
+            token = auth_token.get("data").get("api-key")
         
         if token in valid_api_keys:
             # Authenticated
+            if len(_AUTH_CACHE) >= _AUTH_CACHE_MAX_SIZE:
+                _sweep_auth_cache(now)
+            _AUTH_CACHE[cache_key] = now + _AUTH_TTL
+
             logging.getLogger().info("Result: Authorized")
             return response.Response(
                 ctx, 
                 status_code=200, 
-                response_data=json.dumps({"active": True})
+                response_data=_OK_BODY
             )
     
     except (Exception, ValueError) as ex:
@@ -49,5 +98,5 @@ def handler(ctx, data: io.BytesIO = None):
     return response.Response(
         ctx, 
         status_code=401, 
-        response_data=json.dumps({"active": False, "wwwAuthenticate": "API-key"})
+        response_data=_UNAUTH_BODY
     )
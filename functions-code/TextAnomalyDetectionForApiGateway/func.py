@@ -1,19 +1,21 @@
 import io
-import json
 import logging
 import sys
+import time
 import decimal
 import uuid
-import oci
+import orjson
 
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from fdk import response
+from oci.auth.signers import get_resource_principals_signer
 
 from oci_utils.url_utils import get_image_data_from_url
-from oci_utils.oci_object_storage import create_object_storage_client, put_file_to_object_storage_image, \
-    create_read_only_object_par
-from oci_utils.oci_ai import detect_text_from_oject_storage_image
-from oci_utils.oci_functions import invoke_function
+from oci_utils.oci_object_storage import create_object_storage_client, create_upload_manager, \
+    put_file_to_object_storage_image, create_read_only_object_par
+from oci_utils.oci_ai import create_ai_vision_client, detect_text_from_oject_storage_image
+from oci_utils.oci_functions import get_function_invoke_client, invoke_function_with_client
 from oci_utils.oci_document_generator import prepare_document_generator_payload, build_output_pdf_name
 
 # Setting the decimal context to round down, to ease the Display of fraction
@@ -31,10 +33,48 @@ fn_ocid = "ocid1.fnfunc.oc1.iad..zzz"
 fontfile_name = "part3/Monoton.zip"
 template_name = "part3/TextAnomalyTemplate.docx"
 
+# Validity of the PAR to the PDF report, in seconds.
+par_validity_seconds = 3600
+
 # Create a signer object using the Cloud Shell Resource Principal for authenticating requests.
-signer = oci.auth.signers.get_resource_principals_signer()
+signer = get_resource_principals_signer()
 oci_config= {}
 
+# OCI clients are created once per container and reused across invocations.
+object_storage_client = create_object_storage_client(oci_config, signer=signer)
+upload_manager = create_upload_manager(object_storage_client)
+ai_vision_client = create_ai_vision_client(oci_config, signer=signer)
+
+# Thread pool used to overlap independent OCI round-trips within an invocation.
+executor = ThreadPoolExecutor(max_workers=4)
+
+# Maximum time in seconds to wait for the Document Generator function invoke client to be ready.
+invoke_client_timeout = 60
+
+
+def refresh_signer_security_token():
+    """
+    Refreshes the Resource Principal security token, so the first invocation does not wait for it.
+    A failure is only logged: the signer will refresh the token again when it is used.
+    """
+    try:
+        signer.refresh_security_token()
+    except Exception as ex:
+        logging.info('Error refreshing the signer security token: ' + str(ex))
+
+
+# Refresh the security token in the background on cold start.
+executor.submit(refresh_signer_security_token)
+
+
+def log_invoke_client_error(invoke_client_future):
+    """
+    Logs the failure of a speculative invoke client preparation, which is otherwise unseen when no report is needed.
+    """
+    ex = invoke_client_future.exception()
+    if ex is not None:
+        logging.error('Error preparing the Document Generator invoke client: ' + str(ex))
+
 #
 # Utility Functions
 #
@@ -50,8 +90,13 @@ def all_texts_are_clear_in_the_image(detect_text_response: dict, confidence_leve
     Returns:
         bool: True if all texts have a confidence level above the specified threshold, False otherwise.
     """
-    words = detect_text_response.get("image_text", {}).get("words", [])
-    return all(word.get("confidence", 0) >= confidence_level for word in words)
+    words = detect_text_response.get("image_text", {}).get("words", ())
+
+    # Stop at the first word below the confidence level.
+    for word in words:
+        if word.get("confidence", 0) < confidence_level:
+            return False
+    return True
 
 
 def generate_doc_gen_data_content_from_ai_response(detect_text_response: dict, bucket_name: str, namespace: str,
@@ -69,6 +114,24 @@ def generate_doc_gen_data_content_from_ai_response(detect_text_response: dict, b
         dict: A dictionary formatted to be used as payload for document generation.
     """
     words = detect_text_response.get("image_text", {}).get("words", [])
+
+    # Look up the bounding polygon vertices only once per word.
+    words_content = []
+    for word in words:
+        vertices = word.get("bounding_polygon", {}).get("normalized_vertices") or []
+        if len(vertices) < 3:
+            vertices = [{}, {}, {}]
+        corner1, corner3 = vertices[0], vertices[2]
+        words_content.append({
+            "word": word.get("text"),
+            "confidence": round(word.get("confidence", 0) * 100, 1),
+            # Corners are flattened to keep the payload small: c1 is the top-left, c3 is the bottom-right corner.
+            "c1x": round(corner1.get("x", 0), 2),
+            "c1y": round(corner1.get("y", 0), 2),
+            "c3x": round(corner3.get("x", 0), 2),
+            "c3y": round(corner3.get("y", 0), 2)
+        })
+
     data_content = {
         "image_with_anomalies": {
             "source": "OBJECT_STORAGE",
@@ -78,21 +141,7 @@ def generate_doc_gen_data_content_from_ai_response(detect_text_response: dict, b
             "mediaType": "image/png",
             "height": "450px"
         },
-        "words": [
-            {
-                "word": word.get("text"),
-                "confidence": round(word.get("confidence", 0) * 100, 1),
-                "corner1": {
-                    "x": round(word.get("bounding_polygon", {}).get("normalized_vertices", [])[0].get("x", 0), 2),
-                    "y": round(word.get("bounding_polygon", {}).get("normalized_vertices", [])[0].get("y", 0), 2)
-                },
-                "corner3": {
-                    "x": round(word.get("bounding_polygon", {}).get("normalized_vertices", [])[2].get("x", 0), 2),
-                    "y": round(word.get("bounding_polygon", {}).get("normalized_vertices", [])[2].get("y", 0), 2)
-                }
-            }
-            for word in words
-        ]
+        "words": words_content
     }
     return data_content
 
@@ -101,7 +150,7 @@ def prepare_response(ctx, response_payload, status_code: int = 200):
     return response.Response(
                 ctx, 
                 status_code=status_code,
-                response_data=json.dumps(response_payload),
+                response_data=orjson.dumps(response_payload).decode(),
                 headers={"Content-Type": "application/json"})
 
 
@@ -136,14 +185,16 @@ def handler(ctx, data: io.BytesIO = None):
         #
         # 1. Parse the payload to extract necessary details for processing.
         #
-        payload = json.loads(data.getvalue())
-        logging.info(f"Received payload: {json.dumps(payload)}")
+        payload = orjson.loads(data.getbuffer())
+        logging.debug("Received payload: %s", payload)
 
         bucket_name = "fun_oci_functions_bucket"
         namespace = "idsvv7k2bdum"
         url = payload["url"]
 
-        object_storage_client = create_object_storage_client(oci_config, signer=signer)
+        # Speculatively prepare the Document Generator invoke client while the image is downloaded, stored and analyzed.
+        invoke_client_future = executor.submit(get_function_invoke_client, oci_config, signer, fn_ocid)
+        invoke_client_future.add_done_callback(log_invoke_client_error)
 
         #
         # 2. Read Image data from URL
@@ -160,8 +211,11 @@ def handler(ctx, data: io.BytesIO = None):
         # 3. Store the image in a Bucket
         #
         image_name = "part3/" + str(uuid.uuid4()) + "-" + file_name  # The name you want to assign to the object in OCI
+        output_pdf_name = build_output_pdf_name(image_name)  # The name of the PDF report, if one is generated
         object_storage_response = put_file_to_object_storage_image(object_storage_client,
-                                                                   file_content=file_content,
+                                                                   upload_manager,
+                                                                   file_stream=io.BytesIO(file_content),
+                                                                   content_length=len(file_content),
                                                                    namespace=namespace,
                                                                    bucket_name=bucket_name,
                                                                    object_name=image_name,
@@ -176,7 +230,7 @@ def handler(ctx, data: io.BytesIO = None):
         #
         # 4. Detect texts in the specified object storage image.
         #
-        detect_text_response = detect_text_from_oject_storage_image(oci_config, signer, compartment_id, namespace,
+        detect_text_response = detect_text_from_oject_storage_image(ai_vision_client, compartment_id, namespace,
                                                                     bucket_name, image_name)
         logging.debug(f"detect_text_response: {detect_text_response}")
 
@@ -203,17 +257,18 @@ def handler(ctx, data: io.BytesIO = None):
                                                                       image_name)
 
         # Prepare payload for the Document Generator function.
-        doc_gen_fn_payload = prepare_document_generator_payload(data_content, namespace, bucket_name, image_name,
+        doc_gen_fn_payload = prepare_document_generator_payload(data_content, namespace, bucket_name, output_pdf_name,
                                                                 fontfile_name, template_name)
 
         # Invoke the Document Generator function
-        response = invoke_function(oci_config, signer, fn_ocid, doc_gen_fn_payload)
+        fn_id, invoke_client = invoke_client_future.result(timeout=invoke_client_timeout)
+        response = invoke_function_with_client(invoke_client, fn_id, doc_gen_fn_payload)
         document_generator_response = response.content.decode()
         logging.debug(f"DocGen Response: status code: {response.status_code}, result: {document_generator_response}")
 
         # Handling response and logging based on the statuses.
         if response.status_code == 200:  # This is the Function HTTP response
-            document_generator_response_dict = json.loads(document_generator_response)
+            document_generator_response_dict = orjson.loads(document_generator_response)
             app_response_code = document_generator_response_dict.get("code")
             if app_response_code == 200:  # This is the Document generation application response
                 logging.info("Document generated successfully")
@@ -223,13 +278,13 @@ def handler(ctx, data: io.BytesIO = None):
         #
         # 7. Create PAR with the expiration date and time in 1 Hour from now.
         #
+        par_expiry_time = datetime.fromtimestamp(time.time() + par_validity_seconds, tz=timezone.utc)
         par_status_code, par_full_path = create_read_only_object_par(object_storage_client,
                                                                      "PAR_for_report",
                                                                      namespace=namespace,
                                                                      bucket_name=bucket_name,
-                                                                     object_name=build_output_pdf_name(image_name),
-                                                                     object_expiry_time=datetime.utcnow() + timedelta(
-                                                                         hours=1))
+                                                                     object_name=output_pdf_name,
+                                                                     object_expiry_time=par_expiry_time)
 
         if par_status_code != 200:
             return generate_error_response(ctx, f"PAR generation error. Status code: {par_status_code}")
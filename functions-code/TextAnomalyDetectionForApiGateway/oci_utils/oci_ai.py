@@ -1,7 +1,22 @@
 import oci
 from oci.ai_vision.models import AnalyzeImageDetails, ImageTextDetectionFeature, ObjectStorageImageDetails
 
-def detect_text_from_oject_storage_image(oci_cfg, signer, compartment_id: str, namespace_name: str, bucket_name: str, object_name: str):
+
+def create_ai_vision_client(oci_cfg, signer):
+    """
+    Creates an OCI AI Vision client using the provided configuration and signer.
+
+    Args:
+        oci_cfg (dict): The OCI configuration dictionary containing necessary credentials and settings.
+        signer (object): A security signer object used for authenticating requests to OCI services.
+
+    Returns:
+        oci.ai_vision.AIServiceVisionClient: An instance of the OCI AI Vision client.
+    """
+    return oci.ai_vision.AIServiceVisionClient(oci_cfg, signer=signer)
+
+
+def detect_text_from_oject_storage_image(ai_vision_client, compartment_id: str, namespace_name: str, bucket_name: str, object_name: str):
     """
     Detects text within an image stored in Oracle Cloud Infrastructure (OCI) Object Storage using OCI AI Vision Service.
 
@@ -9,8 +24,7 @@ def detect_text_from_oject_storage_image(oci_cfg, signer, compartment_id: str, n
     It sets up the details of the image stored in Object Storage and specifies the features of text detection to be used.
 
     Args:
-        oci_cfg (dict): The OCI configuration dictionary containing necessary credentials and settings.
-        signer (object): A security signer object used for authenticating requests to OCI services.
+        ai_vision_client (oci.ai_vision.AIServiceVisionClient): The OCI AI Vision client.
         compartment_id (str): The OCI compartment ID where the service and storage are located.
         namespace_name (str): The namespace of the OCI Object Storage where the image is stored.
         bucket_name (str): The name of the OCI Object Storage bucket containing the image.
@@ -23,9 +37,6 @@ def detect_text_from_oject_storage_image(oci_cfg, signer, compartment_id: str, n
         Exception: Any exceptions raised during the API call will propagate, indicating issues like network errors,
                    authentication problems, or misconfigurations in the request parameters.
     """
-    # Create an AI Vision client
-    ai_vision_client = oci.ai_vision.AIServiceVisionClient(oci_cfg, signer=signer)
-
     # Set up the details of the image to be analyzed.
     image_details = ObjectStorageImageDetails()
     image_details.bucket_name = bucket_name
@@ -5,7 +5,7 @@ def build_output_pdf_name(image_name: str):
     return image_name + ".pdf"
 
 
-def prepare_document_generator_payload(data_content, namespace, bucket_name, image_name, fontfile_name, template_name):
+def prepare_document_generator_payload(data_content, namespace, bucket_name, output_name, fontfile_name, template_name):
     """
     Prepares the JSON payload for invoking the OCI Document Generator function.
 
@@ -16,7 +16,7 @@ def prepare_document_generator_payload(data_content, namespace, bucket_name, ima
         data_content (dict): The content data that will be used by the Document Generator to populate the template.
         namespace (str): The OCI Object Storage namespace where the template, fonts, and output will be stored.
         bucket_name (str): The name of the OCI Object Storage bucket for accessing or storing the image, template, fonts and output file.
-        image_name (str): The name of the image file stored in Object Storage in which anomalies were found.
+        output_name (str): The name of the PDF file to generate in Object Storage (see build_output_pdf_name).
         fontfile_name (str): The name of the font file stored in Object Storage to be used in the document generation.
         template_name (str): The name of the document template file stored in Object Storage.
 
@@ -30,9 +30,6 @@ def prepare_document_generator_payload(data_content, namespace, bucket_name, ima
         - The `output` section defines the output specifications, including file name.
     """
 
-    # Generate the output file name based on the template name
-    output_name = build_output_pdf_name(image_name)
-
     # Define the payload as a dictionary.
     payload_dict = {
         "requestType": "SINGLE",  # Indicates a single document generation request.
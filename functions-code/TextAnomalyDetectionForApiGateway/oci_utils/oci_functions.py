@@ -1,21 +1,22 @@
 import oci
 
+# Invoke clients already created, by function OCID: fn_ocid -> (fn_id, invoke_client)
+_invoke_clients = {}
 
-def invoke_function(oci_cfg, signer, fn_ocid: str, fn_payload: str):
-    """
-    Invokes an OCI function with the specified payload.
 
-    This function handles the setup and invocation of an OCI function identified by its Oracle Cloud Identifier (OCID).
-    It retrieves the function's details, configures the invocation client, and sends a request with the provided payload.
+def create_function_invoke_client(oci_cfg, signer, fn_ocid: str):
+    """
+    Retrieves the details of an OCI function and creates the client used to invoke it.
 
     Args:
         oci_cfg (dict): The OCI configuration dictionary containing necessary credentials and settings.
         signer (object): A security signer object used for authenticating requests to OCI services.
         fn_ocid (str): The OCID of the OCI function to be invoked.
-        fn_payload (str): The JSON string payload to be sent to the function.
 
     Returns:
-        bytes: The response data from the function invocation.
+        tuple:
+            - fn_id (str): The ID of the function to invoke.
+            - invoke_client (oci.functions.FunctionsInvokeClient): The client configured for the function's endpoint.
     """
     # Create a Functions Management Client
     fn_management_client = oci.functions.FunctionsManagementClient(oci_cfg, signer=signer)
@@ -31,9 +32,42 @@ def invoke_function(oci_cfg, signer, fn_ocid: str, fn_payload: str):
         signer=signer,
         timeout=(10, fn.timeout_in_seconds)
     )
+    return fn.id, invoke_client
+
+
+def get_function_invoke_client(oci_cfg, signer, fn_ocid: str):
+    """
+    Returns the invoke client of an OCI function, creating it on first use and reusing it afterward.
+
+    Args:
+        oci_cfg (dict): The OCI configuration dictionary containing necessary credentials and settings.
+        signer (object): A security signer object used for authenticating requests to OCI services.
+        fn_ocid (str): The OCID of the OCI function to be invoked.
 
+    Returns:
+        tuple:
+            - fn_id (str): The ID of the function to invoke.
+            - invoke_client (oci.functions.FunctionsInvokeClient): The client configured for the function's endpoint.
+    """
+    if fn_ocid not in _invoke_clients:
+        _invoke_clients[fn_ocid] = create_function_invoke_client(oci_cfg, signer, fn_ocid)
+    return _invoke_clients[fn_ocid]
+
+
+def invoke_function_with_client(invoke_client, fn_id: str, fn_payload: str):
+    """
+    Invokes an OCI function with the specified payload, using an existing invoke client.
+
+    Args:
+        invoke_client (oci.functions.FunctionsInvokeClient): The client configured for the function's endpoint.
+        fn_id (str): The ID of the function to invoke.
+        fn_payload (str): The JSON string payload to be sent to the function.
+
+    Returns:
+        bytes: The response data from the function invocation.
+    """
     # Perform the function invocation using the function ID and the provided payload.
-    resp = invoke_client.invoke_function(fn.id, invoke_function_body=fn_payload)
+    resp = invoke_client.invoke_function(fn_id, invoke_function_body=fn_payload)
 
     # Return the response data from the function invocation.
     return resp.data
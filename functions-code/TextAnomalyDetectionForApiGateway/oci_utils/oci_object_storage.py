@@ -1,4 +1,26 @@
-import oci.object_storage
+from oci.object_storage import ObjectStorageClient, UploadManager
+from oci.object_storage.models import CreatePreauthenticatedRequestDetails
+from oci.retry import RetryStrategyBuilder, BACKOFF_EQUAL_JITTER_VALUE
+
+# Files of this size or larger are uploaded in parts of this size, in parallel.
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_PARALLEL_PROCESS_COUNT = 4
+
+# Short retry budget for Pre-Authenticated Request creation, a small and quick call.
+# Uploads keep the SDK default retry strategy, since a single attempt can take a while.
+_PAR_RETRY_STRATEGY = RetryStrategyBuilder(max_attempts_check=True,
+                                           max_attempts=3,
+                                           total_elapsed_time_check=True,
+                                           total_elapsed_time_seconds=10,
+                                           retry_max_wait_between_calls_seconds=1,
+                                           retry_base_sleep_time_seconds=0.1,
+                                           backoff_type=BACKOFF_EQUAL_JITTER_VALUE).get_retry_strategy()
+
+# Fixed settings of the read-only Pre-Authenticated Requests
+_PAR_DEFAULTS = {
+    "access_type": "ObjectRead",  # Set to ObjectRead to allow read-only access
+    "bucket_listing_action": "Deny",  # Deny bucket listing for security
+}
 
 
 def create_object_storage_client(oci_cfg, signer):
@@ -12,11 +34,28 @@ def create_object_storage_client(oci_cfg, signer):
     Returns:
         oci.object_storage.ObjectStorageClient: An instance of the OCI Object Storage client.
     """
-    return oci.object_storage.ObjectStorageClient(config=oci_cfg, signer=signer)
+    return ObjectStorageClient(config=oci_cfg, signer=signer)
+
+
+def create_upload_manager(object_storage_client):
+    """
+    Creates an OCI Object Storage Upload Manager, used for parallel multipart uploads.
+
+    Args:
+        object_storage_client (oci.object_storage.ObjectStorageClient): The OCI Object Storage client.
+
+    Returns:
+        oci.object_storage.UploadManager: An Upload Manager using the given client.
+    """
+    return UploadManager(object_storage_client,
+                         allow_parallel_uploads=True,
+                         parallel_process_count=MULTIPART_PARALLEL_PROCESS_COUNT)
 
 
 def put_file_to_object_storage_image(object_storage_client,
-                                     file_content: bytes,
+                                     upload_manager,
+                                     file_stream,
+                                     content_length: int,
                                      namespace: str,
                                      bucket_name: str,
                                      object_name: str,
@@ -24,9 +63,13 @@ def put_file_to_object_storage_image(object_storage_client,
     """
     Uploads a file to OCI Object Storage with a specified content type.
 
+    Large files are uploaded as a multipart upload, with parts sent in parallel.
+
     Args:
         object_storage_client (oci.object_storage.ObjectStorageClient): The OCI Object Storage client.
-        file_content (bytes): The content of the file to be uploaded.
+        upload_manager (oci.object_storage.UploadManager): The Upload Manager used for large files.
+        file_stream (io.BytesIO): A seekable file-like object with the content of the file to be uploaded.
+        content_length (int): The size of the file, in bytes.
         namespace (str): The Object Storage namespace where the bucket resides.
         bucket_name (str): The name of the bucket where the file will be uploaded.
         object_name (str): The name of the object (file) in the bucket.
@@ -35,11 +78,21 @@ def put_file_to_object_storage_image(object_storage_client,
     Returns:
         int: The HTTP status code of the response.
     """
+    if content_length >= MULTIPART_PART_SIZE:
+        response = upload_manager.upload_stream(namespace,
+                                                bucket_name,
+                                                object_name,
+                                                file_stream,
+                                                part_size=MULTIPART_PART_SIZE,
+                                                content_type=content_type)
+        return response.status
+
     response = object_storage_client.put_object(
         namespace,
         bucket_name,
         object_name,
-        file_content,
+        file_stream,
+        content_length=content_length,
         content_type=content_type
     )
     return response.status
@@ -68,15 +121,15 @@ def create_read_only_object_par(object_storage_client,
             - par_url (str or None): The full URL of the Pre-Authenticated Request, or None if not available.
     """
 
-    par_details = oci.object_storage.models.CreatePreauthenticatedRequestDetails(
+    par_details = CreatePreauthenticatedRequestDetails(
         name=par_name,
-        access_type="ObjectRead",  # Set to ObjectRead to allow read-only access
-        bucket_listing_action="Deny",  # Deny bucket listing for security
         object_name=object_name,  # Set to the specific object name
-        time_expires=object_expiry_time  # Set expiration for the PAR
+        time_expires=object_expiry_time,  # Set expiration for the PAR
+        **_PAR_DEFAULTS
     )
 
     # Create the PAR in the specified bucket
-    response = object_storage_client.create_preauthenticated_request(namespace, bucket_name, par_details)
+    response = object_storage_client.create_preauthenticated_request(namespace, bucket_name, par_details,
+                                                                      retry_strategy=_PAR_RETRY_STRATEGY)
     return response.status, response.data.full_path if response.data and response.data.full_path else None
 
@@ -1,24 +1,47 @@
-import mimetypes
+import http.cookiejar
+import posixpath
+import urllib.parse
 import requests
-
-
-def get_image_content_type(filename: str) -> str:
+from requests.adapters import HTTPAdapter
+
+# HTTP session reused across invocations while the function container is warm, to keep connections alive.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36",
+    "Accept": "*/*",
+    "Accept-Encoding": "identity",  # Images are already compressed
+})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+# URLs come from different API callers: never keep cookies from one download to the next.
+_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+# File names used when the URL path does not provide one
+_DEFAULT_IMAGE_FILE_NAMES = {
+    "image/jpeg": "image.jpg",
+    "image/png": "image.png",
+}
+
+
+def get_image_content_type(header_content_type: str, content: bytes) -> str:
     """
-    Determine the content type of an image file based on its extension.
+    Determine the content type of an image from the HTTP response Content-Type header, or from its data.
 
     Args:
-        filename (str): The name of the image file.
+        header_content_type (str): The media type from the Content-Type header of the response, possibly empty.
+        content (bytes): The content of the image, in bytes.
 
     Returns:
         str: The content type ("image/jpeg" or "image/png") if recognized, otherwise None.
     """
-    # Guess the MIME type based on the file extension
-    mime_type, _ = mimetypes.guess_type(filename)
+    # Trust the Content-Type header when it is specific
+    if header_content_type in ("image/jpeg", "image/png"):
+        return header_content_type
 
-    # Check for recognized content types
-    if mime_type == "image/jpeg":
+    # Otherwise, check the magic number at the start of the data
+    if content[:3] == b"\xff\xd8\xff":
         return "image/jpeg"
-    elif mime_type == "image/png":
+    elif content[:4] == b"\x89PNG":
         return "image/png"
     else:
         return None
@@ -26,7 +49,7 @@ def get_image_content_type(filename: str) -> str:
 
 def get_data_from_url(url: str):
     """
-    Fetches data from a given URL and extracts the file name.
+    Fetches data from a given URL and extracts the file name from the URL path.
 
     Args:
         url (str): The URL to fetch data from.
@@ -35,18 +58,20 @@ def get_data_from_url(url: str):
         tuple:
             - status_code (int): The HTTP status code of the response.
             - content (bytes): The content of the response, in bytes.
-            - file_name (str): The extracted file name from the URL.
+            - file_name (str): The last segment of the URL path, without query string nor fragment.
+              Empty if the path ends with "/".
+            - content_type (str): The media type from the Content-Type header of the response, or "" if absent.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36",
-        "Accept": "*/*",
-    }
+    # Keep only the path: a query string may contain a signature that must not end up in object names or logs
+    file_name = posixpath.basename(urllib.parse.urlsplit(url).path)
 
-    file_name = url.split('/')[-1]
-
-    # Download the file from URL into memory
-    get_url_response = requests.get(url, headers=headers)
-    return get_url_response.status_code, get_url_response.content, file_name
+    # Stream the file from URL into memory, chunk by chunk
+    with _SESSION.get(url, stream=True, timeout=(3.05, 30)) as get_url_response:
+        content = bytearray()
+        for chunk in get_url_response.iter_content(chunk_size=65536):
+            content.extend(chunk)
+        content_type = get_url_response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        return get_url_response.status_code, bytes(content), file_name, content_type
 
 
 def get_image_data_from_url(url: str):
@@ -60,12 +85,17 @@ def get_image_data_from_url(url: str):
         tuple:
             - status_code (int): The HTTP status code of the response.
             - content (bytes): The content of the image, in bytes.
-            - file_name (str): The extracted file name from the URL.
+            - file_name (str): The extracted file name from the URL path, or "image.jpg" / "image.png"
+              when the path has no file name.
             - content_type (str): The content type of the image
               (e.g., "image/jpeg" or "image/png"). Returns None if the
               content type is not recognized.
     """
-    status_code, content, file_name = get_data_from_url(url)
+    status_code, content, file_name, header_content_type = get_data_from_url(url)
+
+    content_type = get_image_content_type(header_content_type, content)
 
-    content_type = get_image_content_type(file_name)
+    # Name the image after its content type when the URL path has no file name (e.g. "https://host/images/")
+    if not file_name and content_type:
+        file_name = _DEFAULT_IMAGE_FILE_NAMES[content_type]
     return status_code, content, file_name, content_type